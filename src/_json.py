@@ -0,0 +1,27 @@
+"""JSON helpers backed by orjson when the ``speedups`` extra is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+else:
+    loads = json.loads
+
+
+def canonical_key(obj: Any) -> bytes:
+    """Serialize ``obj`` to sorted-key JSON bytes for use as a cache/dedup key.
+
+    Uses orjson when installed (an order of magnitude faster than
+    ``json.dumps(sort_keys=True)`` for search params).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
@@ -0,0 +1,132 @@
+"""In-process LRU + TTL cache for search results."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# Approximate JSON width of a number (a float64 repr is up to ~20 chars)
+_NUMBER_SIZE = 20
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate the JSON-encoded size of ``obj`` in bytes without encoding it.
+
+    Lists whose first element is a number are treated as numeric arrays and sized
+    from their length, so embedding vectors cost O(1) rather than O(dimensions).
+    """
+    kind = type(obj)
+    if kind is str:
+        return len(obj) + 2
+    if kind is dict:
+        size = 2
+        for key, value in obj.items():
+            size += len(key) + 4
+            size += len(value) + 2 if type(value) is str else estimate_size(value)
+        return size
+    if kind is list or kind is tuple:
+        if obj and type(obj[0]) in (int, float):
+            return 2 + len(obj) * _NUMBER_SIZE
+        return 2 + sum(estimate_size(value) + 1 for value in obj)
+    return _NUMBER_SIZE
+
+
+class QueryCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl_seconds``.
+
+    The cache is bounded both by entry count (``max_size``) and by the total
+    approximate size of its values (``max_bytes``, see ``estimate_size``), since one search result can
+    be orders of magnitude larger than another. A ``max_size``, ``max_bytes``
+    or ``ttl_seconds`` of zero disables caching; every lookup then falls
+    through to the compute function.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 60, max_bytes: int = 64 << 20):
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._max_bytes > 0 and self._ttl > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries if full.
+
+        Values larger than ``max_bytes`` on their own are not cached.
+        """
+        if not self.enabled:
+            return
+        size = estimate_size(value)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self._ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self._max_size or self._bytes > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``compute`` runs outside the lock so a slow search does not block other
+        lookups; concurrent misses on the same key may each compute it.
+        """
+        if not self.enabled:
+            return compute()
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
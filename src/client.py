@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from typing import Callable
+
+import httpx
 import typesense
+from typesense.exceptions import TypesenseClientError
 
+from ._json import canonical_key
+from .cache import QueryCache
 from .config import TypesenseConfig
+from .nl_cache import NLQueryCache
+
+logger = logging.getLogger(__name__)
+
+
+def vector_field_names(fields: list[dict]) -> frozenset[str]:
+    """Return the names of vector fields (auto-embedded or with a num_dim) in a schema."""
+    return frozenset(
+        f["name"] for f in fields
+        if f.get("embed") is not None or f.get("num_dim")
+    )
 
 
 class TypesenseClientManager:
@@ -13,13 +33,65 @@ class TypesenseClientManager:
     def __init__(self, config: TypesenseConfig | None = None):
         self._config = config or TypesenseConfig()
         self._client: typesense.Client | None = None
+        self._http_client: httpx.Client | None = None
+        # Tools run in worker threads, so concurrent first calls must not each
+        # build (and leak) their own client and connection pool.
+        self._client_lock = threading.Lock()
+        # Vector fields change rarely; cache them briefly so RAG and chunk tools
+        # don't fetch the schema on every call. Introspection tools read the
+        # schema live so num_documents is never stale.
+        self._vector_fields: dict[str, tuple[float, frozenset[str]]] = {}
+        # Local result cache for the user-facing search tools, so a repeated
+        # query skips the network entirely.
+        self.query_cache = QueryCache(
+            self._config.query_cache_size,
+            self._config.query_cache_ttl,
+            self._config.query_cache_max_bytes,
+        )
+        self.nl_cache: NLQueryCache | None = None
+        if self._config.nl_cache_path:
+            self.nl_cache = NLQueryCache(
+                self._config.nl_cache_path, self._config.nl_cache_ttl
+            )
 
     @property
     def client(self) -> typesense.Client:
-        if self._client is None:
-            self._client = typesense.Client(self._config.to_client_config())
+        if self._client is not None:
+            return self._client
+        with self._client_lock:
+            if self._client is None:
+                # Own the HTTP client so the keep-alive pool (size and idle expiry)
+                # is tuned for long-lived MCP sessions rather than httpx defaults.
+                http_client = httpx.Client(
+                    timeout=self._config.connection_timeout,
+                    limits=httpx.Limits(
+                        max_connections=self._config.max_connections,
+                        max_keepalive_connections=self._config.max_keepalive_connections,
+                        keepalive_expiry=self._config.keepalive_expiry,
+                    ),
+                )
+                try:
+                    self._client = typesense.Client(
+                        self._config.to_client_config(), http_client=http_client
+                    )
+                except Exception:
+                    http_client.close()
+                    raise
+                self._http_client = http_client
         return self._client
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections.
+
+        typesense.Client never closes an http_client it is handed, so the
+        manager owns it. A later call rebuilds the client lazily.
+        """
+        with self._client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._client = None
+            self._http_client = None
+
     def health(self) -> dict:
         return {"ok": self.client.operations.is_healthy()}
 
@@ -31,12 +103,82 @@ class TypesenseClientManager:
     def get_collection(self, name: str) -> dict:
         return self.client.collections[name].retrieve()
 
+    def vector_fields(self, name: str) -> frozenset[str]:
+        """Vector field names for a collection, cached for ``schema_cache_ttl`` seconds.
+
+        Excluding vectors is only an optimization, so a schema that cannot be
+        read (e.g. with a search-only API key) yields an empty set instead of
+        failing the calling tool. That fallback is cached too, so such keys
+        don't retry the lookup on every call.
+        """
+        ttl = self._config.schema_cache_ttl
+        now = time.monotonic()
+        cached = self._vector_fields.get(name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        try:
+            fields = vector_field_names(self.get_collection(name).get("fields", []))
+        except TypesenseClientError as exc:
+            logger.debug("Schema lookup for %r failed, not excluding vectors: %s", name, exc)
+            fields = frozenset()
+        if ttl > 0:
+            self._vector_fields[name] = (now + ttl, fields)
+        return fields
+
     # -- Search ---------------------------------------------------------------
 
-    def search(self, collection: str, params: dict) -> dict:
+    def search(self, collection: str, params: dict, cache: bool = True) -> dict:
+        """Run a search, opting into Typesense's server-side result cache by default."""
+        if cache:
+            params = self._with_search_cache(params)
         return self.client.collections[collection].documents.search(params)
 
-    def multi_search(self, searches: list[dict], common_params: dict | None = None) -> dict:
+    def cached_search(
+        self,
+        collection: str,
+        params: dict,
+        transform: Callable[[dict], dict],
+    ) -> dict:
+        """Run a search through the local query cache.
+
+        ``transform`` reduces the raw Typesense response to what the caller
+        returns, and only its output is cached. It must be the same for every
+        caller, since the cache key covers only the collection and params.
+        """
+        key = (collection, canonical_key(params))
+        return self.query_cache.get_or_compute(
+            key, lambda: transform(self.search(collection, params))
+        )
+
+    def multi_search(
+        self,
+        searches: list[dict],
+        common_params: dict | None = None,
+        cache: bool = True,
+    ) -> dict:
+        """Run a multi-search, opting into Typesense's result cache by default."""
         body = {"searches": searches}
-        return self.client.multi_search.perform(body, common_params or {})
+        common_params = common_params or {}
+        if cache:
+            common_params = self._with_search_cache(common_params)
+        return self.client.multi_search.perform(body, common_params)
+
+    def search_many(
+        self,
+        searches: list[dict],
+        common_params: dict | None = None,
+        cache: bool = True,
+    ) -> list[dict]:
+        """Run independent searches in one multi_search round-trip.
+
+        Returns one result per entry in ``searches``, in the same order.
+        """
+        return self.multi_search(searches, common_params, cache).get("results", [])
+
+    def _with_search_cache(self, params: dict) -> dict:
+        """Add use_cache/cache_ttl unless disabled or already set by the caller."""
+        ttl = self._config.search_cache_ttl
+        if ttl <= 0:
+            return params
+        return {"use_cache": True, "cache_ttl": ttl, **params}
 
@@ -5,22 +5,53 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 
+# Connection settings never change mid-process, so the environment is read once
+# at import time rather than on every TypesenseConfig() construction.
+_HOST = os.environ.get("TYPESENSE_HOST", "localhost")
+_PORT = os.environ.get("TYPESENSE_PORT", "8108")
+_PROTOCOL = os.environ.get("TYPESENSE_PROTOCOL", "http")
+_API_KEY = os.environ.get("TYPESENSE_API_KEY", "")
+_CONNECTION_TIMEOUT = int(os.environ.get("TYPESENSE_CONNECTION_TIMEOUT", "10"))
+_SCHEMA_CACHE_TTL = float(os.environ.get("TYPESENSE_SCHEMA_CACHE_TTL", "60"))
+_SEARCH_CACHE_TTL = int(os.environ.get("TYPESENSE_SEARCH_CACHE_TTL", "60"))
+_QUERY_CACHE_SIZE = int(os.environ.get("TYPESENSE_QUERY_CACHE_SIZE", "256"))
+_QUERY_CACHE_MAX_BYTES = int(os.environ.get("TYPESENSE_QUERY_CACHE_MAX_BYTES", "67108864"))
+_QUERY_CACHE_TTL = float(os.environ.get("TYPESENSE_QUERY_CACHE_TTL", "60"))
+_NL_CACHE_PATH = os.environ.get("TYPESENSE_NL_CACHE_PATH", "")
+_NL_CACHE_TTL = float(os.environ.get("TYPESENSE_NL_CACHE_TTL", "3600"))
+_MAX_CONNECTIONS = int(os.environ.get("TYPESENSE_MAX_CONNECTIONS", "100"))
+_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("TYPESENSE_MAX_KEEPALIVE_CONNECTIONS", "50"))
+_KEEPALIVE_EXPIRY = float(os.environ.get("TYPESENSE_KEEPALIVE_EXPIRY", "60"))
 
-@dataclass
+
+@dataclass(slots=True)
 class TypesenseConfig:
     """Configuration for connecting to a Typesense cluster."""
 
-    host: str = field(default_factory=lambda: os.environ.get("TYPESENSE_HOST", "localhost"))
-    port: str = field(default_factory=lambda: os.environ.get("TYPESENSE_PORT", "8108"))
-    protocol: str = field(default_factory=lambda: os.environ.get("TYPESENSE_PROTOCOL", "http"))
-    api_key: str = field(default_factory=lambda: os.environ.get("TYPESENSE_API_KEY", ""))
-    connection_timeout: int = field(
-        default_factory=lambda: int(os.environ.get("TYPESENSE_CONNECTION_TIMEOUT", "10"))
-    )
+    host: str = field(default=_HOST)
+    port: str = field(default=_PORT)
+    protocol: str = field(default=_PROTOCOL)
+    api_key: str = field(default=_API_KEY)
+    connection_timeout: int = field(default=_CONNECTION_TIMEOUT)
+    schema_cache_ttl: float = field(default=_SCHEMA_CACHE_TTL)
+    search_cache_ttl: int = field(default=_SEARCH_CACHE_TTL)
+    query_cache_size: int = field(default=_QUERY_CACHE_SIZE)
+    query_cache_max_bytes: int = field(default=_QUERY_CACHE_MAX_BYTES)
+    query_cache_ttl: float = field(default=_QUERY_CACHE_TTL)
+    # SQLite file for persisting natural language search results; empty disables.
+    nl_cache_path: str = field(default=_NL_CACHE_PATH)
+    nl_cache_ttl: float = field(default=_NL_CACHE_TTL)
+    # HTTP connection pool shared by all Typesense requests. Keep-alive
+    # connections should cover the expected number of concurrent tool calls,
+    # and outlive the gaps between chatbot turns, so requests reuse warm
+    # TCP/TLS connections instead of re-handshaking.
+    max_connections: int = field(default=_MAX_CONNECTIONS)
+    max_keepalive_connections: int = field(default=_MAX_KEEPALIVE_CONNECTIONS)
+    keepalive_expiry: float = field(default=_KEEPALIVE_EXPIRY)
+    _client_config: dict = field(init=False, repr=False, compare=False)
 
-    def to_client_config(self) -> dict:
-        """Convert to a typesense client configuration dict."""
-        return {
+    def __post_init__(self) -> None:
+        self._client_config = {
             "nodes": [
                 {
                     "host": self.host,
@@ -31,3 +62,11 @@ class TypesenseConfig:
             "api_key": self.api_key,
             "connection_timeout_seconds": self.connection_timeout,
         }
+
+    def to_client_config(self) -> dict:
+        """Convert to a typesense client configuration dict.
+
+        The dict is built once per instance; treat the config as immutable after
+        construction and do not mutate the returned value.
+        """
+        return self._client_config
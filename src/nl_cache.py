@@ -0,0 +1,61 @@
+"""Persistent SQLite cache for natural language search results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from ._json import canonical_key, loads
+
+
+class NLQueryCache:
+    """Disk-backed cache of natural_language_search results.
+
+    Each NL search costs an LLM round-trip inside Typesense, so repeat
+    questions are served from SQLite instead, and survive server restarts.
+    Entries expire after ``ttl_seconds``.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 3600):
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS nl_cache ("
+                "hash TEXT PRIMARY KEY, result TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM nl_cache WHERE expires_at <= ?", (time.time(),))
+
+    @staticmethod
+    def key(collection: str, params: dict) -> str:
+        """Hash a collection name and its full search params into a cache key."""
+        return hashlib.sha256(collection.encode() + b"\0" + canonical_key(params)).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, expires_at FROM nl_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM nl_cache WHERE hash = ?", (key,))
+                return None
+        return loads(row[0])
+
+    def put(self, key: str, result: dict) -> None:
+        payload = json.dumps(result)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO nl_cache (hash, result, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + self._ttl),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -8,6 +8,9 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Final
 
 from fastmcp import FastMCP
 from starlette.middleware import Middleware
@@ -17,7 +20,6 @@ from starlette.responses import JSONResponse, Response
 
 from .client import TypesenseClientManager
 from .config import TypesenseConfig
-from .tools import collections, rag, search
 
 logger = logging.getLogger(__name__)
 
@@ -30,20 +32,9 @@ CORS_MIDDLEWARE = Middleware(
     expose_headers=["*"],
 )
 
-
-def create_server(config: TypesenseConfig | None = None) -> FastMCP:
-    """Create and configure the Typesense MCP server.
-
-    Args:
-        config: Optional Typesense connection configuration.
-            If None, reads from environment variables.
-
-    Returns:
-        A configured FastMCP server instance ready to run.
-    """
-    mcp = FastMCP(
-        "typesense-mcp",
-        instructions="""Typesense MCP Server — read-only search interface for RAG applications.
+# Instructions advertised to MCP clients on initialize
+_INSTRUCTIONS: Final[str] = """\
+Typesense MCP Server — read-only search interface for RAG applications.
 
 This server connects to a Typesense 29.0+ cluster and provides search and
 collection introspection tools. It does NOT provide write operations.
@@ -67,10 +58,35 @@ collection introspection tools. It does NOT provide write operations.
 
 **Filter syntax:** field:=value, field:!=value, field:>N, field:<N, field:[val1,val2]
 Combine with && (AND) and || (OR).
-""",
-    )
+"""
 
+
+def create_server(config: TypesenseConfig | None = None) -> FastMCP:
+    """Create and configure the Typesense MCP server.
+
+    Args:
+        config: Optional Typesense connection configuration.
+            If None, reads from environment variables.
+
+    Returns:
+        A configured FastMCP server instance ready to run.
+    """
     ts = TypesenseClientManager(config)
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        # Release the pooled Typesense connections on shutdown
+        try:
+            yield
+        finally:
+            ts.close()
+
+    mcp = FastMCP(
+        "typesense-mcp",
+        instructions=_INSTRUCTIONS,
+        lifespan=lifespan,
+    )
+
     ts_config = config or TypesenseConfig()
     logger.info(
         "Typesense target: %s://%s:%s",
@@ -79,7 +95,11 @@ Combine with && (AND) and || (OR).
         ts_config.port,
     )
 
-    # Register read-only tool modules (search + collection introspection)
+    # Register read-only tool modules (search + collection introspection).
+    # Imported here so importing this module (e.g. for CORS_MIDDLEWARE) does not
+    # pay for loading every tool module up front.
+    from .tools import collections, rag, search
+
     collections.register(mcp, ts)
     search.register(mcp, ts)
     rag.register(mcp, ts)
@@ -0,0 +1,27 @@
+"""Shared helpers for the Typesense MCP tool modules."""
+
+from __future__ import annotations
+
+# Typesense's per_page ceiling
+MAX_PER_PAGE = 250
+
+
+def strip_vector_fields(doc: dict, vector_fields: frozenset[str]) -> dict:
+    """Return ``doc`` without its vector fields.
+
+    Documents carrying none of those fields, the norm once they are excluded
+    server-side, are returned as-is rather than copied.
+    """
+    if vector_fields.isdisjoint(doc):
+        return doc
+    return {k: v for k, v in doc.items() if k not in vector_fields}
+
+
+def and_filters(*parts: str) -> str:
+    """Join non-empty Typesense filter expressions with ``&&``."""
+    return " && ".join(p for p in parts if p)
+
+
+def clamp_per_page(per_page: int, limit: int = MAX_PER_PAGE) -> int:
+    """Cap per_page at ``limit`` (a conditional expression is cheaper than min())."""
+    return limit if per_page > limit else per_page
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from fastmcp import FastMCP
+from typesense.exceptions import TypesenseClientError
 
-from ..client import TypesenseClientManager
+from ..client import TypesenseClientManager, vector_field_names
+from ._utils import strip_vector_fields
 
 
 def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
@@ -86,42 +88,56 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         col = ts.get_collection(collection_name)
         fields = col.get("fields", [])
 
-        # Get sample documents
-        search_result = ts.search(collection_name, {
-            "q": "*",
-            "per_page": sample_size,
-        })
-
-        samples = []
-        for hit in search_result.get("hits", []):
-            doc = hit.get("document", {})
-            # Exclude embedding fields from samples to keep output concise
-            cleaned = {
-                k: v for k, v in doc.items()
-                if not isinstance(v, list) or not (v and isinstance(v[0], (int, float)))
-                or len(v) < 50
-            }
-            samples.append(cleaned)
+        # Exclude vector fields from samples to keep output concise. Typesense
+        # drops them server-side so the vectors never cross the wire.
+        vector_fields = vector_field_names(fields)
 
-        # Identify facetable fields and get value distributions
-        facet_fields = [f["name"] for f in fields if f.get("facet")]
-        facet_summaries = {}
+        # Sample documents and facet value distributions are fetched in a single
+        # multi_search round-trip.
+        sample_search: dict = {"collection": collection_name, "q": "*", "per_page": sample_size}
+        if vector_fields:
+            sample_search["exclude_fields"] = ",".join(sorted(vector_fields))
+        searches = [sample_search]
 
+        facet_fields = [f["name"] for f in fields if f.get("facet")]
         if facet_fields:
-            facet_result = ts.search(collection_name, {
+            searches.append({
+                "collection": collection_name,
                 "q": "*",
                 "facet_by": ",".join(facet_fields[:10]),
                 "max_facet_values": 10,
                 "per_page": 0,
             })
-            for fc in facet_result.get("facet_counts", []):
-                facet_summaries[fc["field_name"]] = {
-                    "total_values": fc.get("stats", {}).get("total_values", None),
-                    "top_values": [
-                        {"value": v["value"], "count": v["count"]}
-                        for v in fc.get("counts", [])[:10]
-                    ],
-                }
+
+        results = ts.search_many(searches)
+        # multi_search reports a failed sub-search inline rather than raising,
+        # so surface it the way a standalone search would.
+        for result in results:
+            if "error" in result:
+                raise TypesenseClientError(
+                    f"analyze_collection search on '{collection_name}' failed "
+                    f"({result.get('code')}): {result['error']}"
+                )
+        search_result = results[0]
+        facet_result = results[1] if len(results) > 1 else {}
+        # The schema may be cached and its num_documents stale; the match-all
+        # sample search reports the live count.
+        num_documents = search_result.get("found", col.get("num_documents", 0))
+
+        samples = [
+            strip_vector_fields(hit.get("document", {}), vector_fields)
+            for hit in search_result.get("hits", [])
+        ]
+
+        facet_summaries = {}
+        for fc in facet_result.get("facet_counts", []):
+            facet_summaries[fc["field_name"]] = {
+                "total_values": fc.get("stats", {}).get("total_values", None),
+                "top_values": [
+                    {"value": v["value"], "count": v["count"]}
+                    for v in fc.get("counts", [])[:10]
+                ],
+            }
 
         # Identify embedding/vector fields
         embedding_fields = [
@@ -131,7 +147,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
 
         return {
             "name": col["name"],
-            "num_documents": col.get("num_documents", 0),
+            "num_documents": num_documents,
             "fields": [
                 {
                     "name": f["name"],
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections import defaultdict
 from typing import Any
 
 from fastmcp import FastMCP
 
 from ..client import TypesenseClientManager
+from ._utils import and_filters, clamp_per_page, strip_vector_fields
 
 
 def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
     """Register RAG retrieval tools on the MCP server."""
 
     @mcp.tool()
-    def rag_search_and_retrieve_chunks(
+    async def rag_search_and_retrieve_chunks(
         metadata_collection: str,
         chunks_collection: str,
         query: str,
@@ -54,16 +57,25 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             chunks_filter_by: Additional filter for chunks beyond the doc_id link.
             exclude_fields: Fields to exclude from chunks (e.g., embedding fields).
         """
+        # The Typesense client is synchronous, so calls run in worker threads.
+        # Both schemas are looked up concurrently (usually cache hits).
+        meta_vector_fields, chunk_vector_fields = await asyncio.gather(
+            asyncio.to_thread(ts.vector_fields, metadata_collection),
+            asyncio.to_thread(ts.vector_fields, chunks_collection),
+        )
+
         # Step 1: Search metadata collection
         meta_params: dict[str, Any] = {
             "q": query,
             "query_by": query_by,
-            "per_page": min(per_page, 50),
+            "per_page": clamp_per_page(per_page, 50),
         }
         if filter_by:
             meta_params["filter_by"] = filter_by
+        if meta_vector_fields:
+            meta_params["exclude_fields"] = _merge_exclude_fields("", meta_vector_fields)
 
-        meta_result = ts.search(metadata_collection, meta_params)
+        meta_result = await asyncio.to_thread(ts.search, metadata_collection, meta_params)
         meta_hits = meta_result.get("hits", [])
 
         if not meta_hits:
@@ -74,21 +86,13 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             }
 
         # Step 2: Extract doc_ids from metadata results
-        doc_ids = []
-        metadata_by_id: dict[str, dict] = {}
+        linked_docs: list[tuple[str, dict]] = []
         for hit in meta_hits:
             doc = hit.get("document", {})
             did = doc.get(doc_id_field)
             if did is not None:
-                did_str = str(did)
-                doc_ids.append(did_str)
-                if include_metadata:
-                    # Store metadata, excluding large embedding fields
-                    metadata_by_id[did_str] = {
-                        k: v for k, v in doc.items()
-                        if not (isinstance(v, list) and len(v) > 50
-                                and v and isinstance(v[0], (int, float)))
-                    }
+                linked_docs.append((str(did), doc))
+        doc_ids = [did for did, _ in linked_docs]
 
         if not doc_ids:
             return {
@@ -99,37 +103,45 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
 
         # Step 3: Fetch chunks for all matched doc_ids
         # Build filter for chunks: doc_id in [id1, id2, ...]
-        escaped_ids = [did.replace("`", "\\`") for did in doc_ids]
-        chunk_filter = f"{doc_id_field}:[{','.join(escaped_ids)}]"
-        if chunks_filter_by:
-            chunk_filter = f"{chunk_filter} && {chunks_filter_by}"
+        # IDs almost never contain backticks, so only escape when one does.
+        ids = ",".join(doc_ids)
+        if "`" in ids:
+            ids = ",".join(did.replace("`", "\\`") for did in doc_ids)
+        chunk_filter = and_filters(f"{doc_id_field}:[{ids}]", chunks_filter_by)
 
         chunk_params: dict[str, Any] = {
             "q": "*",
             "query_by": chunk_content_field,
             "filter_by": chunk_filter,
-            "per_page": min(chunks_per_doc * len(doc_ids), 250),
+            "per_page": clamp_per_page(chunks_per_doc * len(doc_ids)),
         }
         if chunks_sort_by:
             chunk_params["sort_by"] = chunks_sort_by
-        if exclude_fields:
-            chunk_params["exclude_fields"] = exclude_fields
+        chunk_excludes = _merge_exclude_fields(exclude_fields, chunk_vector_fields)
+        if chunk_excludes:
+            chunk_params["exclude_fields"] = chunk_excludes
+
+        chunks_search = asyncio.create_task(
+            asyncio.to_thread(ts.search, chunks_collection, chunk_params)
+        )
+
+        # Clean metadata documents while the chunks search is in flight
+        metadata_by_id: dict[str, dict] = {}
+        if include_metadata:
+            for did, doc in linked_docs:
+                metadata_by_id[did] = strip_vector_fields(doc, meta_vector_fields)
 
-        chunks_result = ts.search(chunks_collection, chunk_params)
+        chunks_result = await chunks_search
 
         # Step 4: Organize chunks by doc_id
-        chunks_by_doc: dict[str, list[dict]] = {did: [] for did in doc_ids}
+        # Only doc_ids that actually receive chunks get a list; the chunk filter
+        # already restricts hits to the requested doc_ids.
+        chunks_by_doc: defaultdict[str, list[dict]] = defaultdict(list)
         for hit in chunks_result.get("hits", []):
             doc = hit.get("document", {})
             did = str(doc.get(doc_id_field, ""))
-            if did in chunks_by_doc:
-                # Clean up chunk document (remove embedding vectors)
-                cleaned = {
-                    k: v for k, v in doc.items()
-                    if not (isinstance(v, list) and len(v) > 50
-                            and v and isinstance(v[0], (int, float)))
-                }
-                chunks_by_doc[did].append(cleaned)
+            # Clean up chunk document (remove embedding vectors)
+            chunks_by_doc[did].append(strip_vector_fields(doc, chunk_vector_fields))
 
         # Step 5: Build final results
         results = []
@@ -185,7 +197,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         params: dict[str, Any] = {
             "q": query,
             "query_by": query_by,
-            "per_page": min(per_page, 250),
+            "per_page": clamp_per_page(per_page),
             "rerank_hybrid_matches": rerank_hybrid_matches,
         }
 
@@ -252,34 +264,18 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             exclude_fields: Fields to exclude (recommend excluding embedding fields).
             include_fields: Fields to include.
         """
-        chunk_filter = f"{doc_id_field}:={doc_id}"
-        if filter_by:
-            chunk_filter = f"{chunk_filter} && {filter_by}"
-
-        params: dict[str, Any] = {
-            "q": "*",
-            "query_by": doc_id_field,
-            "filter_by": chunk_filter,
-            "per_page": min(per_page, 250),
-        }
-        if sort_by:
-            params["sort_by"] = sort_by
-        if exclude_fields:
-            params["exclude_fields"] = exclude_fields
-        if include_fields:
-            params["include_fields"] = include_fields
+        vector_fields = ts.vector_fields(chunks_collection)
+        params = _document_chunks_params(
+            doc_id, doc_id_field, sort_by, filter_by, exclude_fields, include_fields, vector_fields
+        )
+        params["per_page"] = clamp_per_page(per_page)
 
         result = ts.search(chunks_collection, params)
 
-        chunks = []
-        for hit in result.get("hits", []):
-            doc = hit.get("document", {})
-            cleaned = {
-                k: v for k, v in doc.items()
-                if not (isinstance(v, list) and len(v) > 50
-                        and v and isinstance(v[0], (int, float)))
-            }
-            chunks.append(cleaned)
+        chunks = [
+            strip_vector_fields(hit.get("document", {}), vector_fields)
+            for hit in result.get("hits", [])
+        ]
 
         return {
             "doc_id": doc_id,
@@ -287,3 +283,96 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             "total_found": result.get("found", 0),
             "chunks": chunks,
         }
+
+    @mcp.tool()
+    def get_all_document_chunks(
+        chunks_collection: str,
+        doc_id: str,
+        doc_id_field: str = "doc_id",
+        sort_by: str = "",
+        filter_by: str = "",
+        limit: int = 1000,
+        exclude_fields: str = "",
+        include_fields: str = "",
+    ) -> dict:
+        """Retrieve a document's chunks, paging past the 250-per-request cap.
+
+        Use this instead of get_document_chunks for long documents with more chunks
+        than fit in a single page.
+
+        Args:
+            chunks_collection: Name of the chunks/embeddings collection.
+            doc_id: The document ID to retrieve chunks for.
+            doc_id_field: The field name for doc_id in the chunks collection (default "doc_id").
+            sort_by: Sort expression for chunks (e.g., "chunk_index:asc").
+            filter_by: Additional filter expression to apply.
+            limit: Max chunks to return, at least 1 (default 1000, i.e. at most four requests).
+                Raise it only when the whole document is really needed;
+                total_found reports how many chunks exist.
+            exclude_fields: Fields to exclude (embedding fields are excluded automatically
+                when the collection schema is readable).
+            include_fields: Fields to include.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        vector_fields = ts.vector_fields(chunks_collection)
+        params = _document_chunks_params(
+            doc_id, doc_id_field, sort_by, filter_by, exclude_fields, include_fields, vector_fields
+        )
+
+        # Typesense pages by offset = (page - 1) * per_page, so the page size
+        # must stay fixed across requests; overshoot is trimmed afterwards.
+        page_size = clamp_per_page(limit)
+        chunks: list[dict] = []
+        found = 0
+        page = 1
+        while True:
+            result = ts.search(chunks_collection, {**params, "page": page, "per_page": page_size})
+            hits = result.get("hits", [])
+            found = result.get("found", 0)
+            chunks.extend(
+                strip_vector_fields(hit.get("document", {}), vector_fields) for hit in hits
+            )
+            if len(hits) < page_size or len(chunks) >= found or len(chunks) >= limit:
+                break
+            page += 1
+        del chunks[limit:]
+
+        return {
+            "doc_id": doc_id,
+            "chunk_count": len(chunks),
+            "total_found": found,
+            "chunks": chunks,
+        }
+
+
+def _document_chunks_params(
+    doc_id: str,
+    doc_id_field: str,
+    sort_by: str,
+    filter_by: str,
+    exclude_fields: str,
+    include_fields: str,
+    vector_fields: frozenset[str],
+) -> dict[str, Any]:
+    """Build the search params that select one document's chunks, without paging."""
+    params: dict[str, Any] = {
+        "q": "*",
+        "query_by": doc_id_field,
+        "filter_by": and_filters(f"{doc_id_field}:={doc_id}", filter_by),
+    }
+    if sort_by:
+        params["sort_by"] = sort_by
+    excludes = _merge_exclude_fields(exclude_fields, vector_fields)
+    if excludes:
+        params["exclude_fields"] = excludes
+    if include_fields:
+        params["include_fields"] = include_fields
+    return params
+
+
+def _merge_exclude_fields(exclude_fields: str, vector_fields: frozenset[str]) -> str:
+    """Combine user-supplied exclude_fields with a collection's vector fields."""
+    requested = [f.strip() for f in exclude_fields.split(",") if f.strip()]
+    return ",".join(dict.fromkeys([*requested, *sorted(vector_fields)]))
+
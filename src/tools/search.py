@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Any
 
 from fastmcp import FastMCP
 
+from .._json import canonical_key, loads
 from ..client import TypesenseClientManager
+from ._utils import clamp_per_page
 
 
 def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
@@ -69,7 +71,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         params: dict[str, Any] = {
             "q": query,
             "query_by": query_by,
-            "per_page": min(per_page, 250),
+            "per_page": clamp_per_page(per_page),
             "page": page,
             "rerank_hybrid_matches": rerank_hybrid_matches,
         }
@@ -83,11 +85,10 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         elif alpha != 0.3:
             # If no explicit vector_query but alpha is set, we need to find the
             # embedding field from query_by and set alpha on it
-            fields = [f.strip() for f in query_by.split(",")]
-            for field in fields:
-                # The user should include an embedding field in query_by for hybrid
+            # The user should include an embedding field in query_by for hybrid
+            field = _first_field(query_by)
+            if field:
                 params["vector_query"] = f"{field}:([], k:{per_page * 5}, alpha:{alpha})"
-                break
         if group_by:
             params["group_by"] = group_by
             params["group_limit"] = group_limit
@@ -103,8 +104,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         if highlight_fields:
             params["highlight_fields"] = highlight_fields
 
-        result = ts.search(collection_name, params)
-        return _format_search_result(result)
+        return ts.cached_search(collection_name, params, _format_search_result)
 
     @mcp.tool()
     def keyword_search(
@@ -143,7 +143,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         params: dict[str, Any] = {
             "q": query,
             "query_by": query_by,
-            "per_page": min(per_page, 250),
+            "per_page": clamp_per_page(per_page),
             "page": page,
         }
 
@@ -161,8 +161,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         if exclude_fields:
             params["exclude_fields"] = exclude_fields
 
-        result = ts.search(collection_name, params)
-        return _format_search_result(result)
+        return ts.cached_search(collection_name, params, _format_search_result)
 
     @mcp.tool()
     def natural_language_search(
@@ -208,7 +207,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             "query_by": query_by,
             "nl_query": True,
             "nl_model_id": nl_model_id,
-            "per_page": min(per_page, 250),
+            "per_page": clamp_per_page(per_page),
             "page": page,
         }
 
@@ -227,8 +226,27 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         if facet_by:
             params["facet_by"] = facet_by
 
-        result = ts.search(collection_name, params)
-        return _format_search_result(result)
+        # Serve repeat questions from the persistent NL cache when configured.
+        # Debug responses are never cached so they cannot leak into normal ones.
+        nl_cache = None if nl_query_debug else ts.nl_cache
+        if nl_cache is not None:
+            cache_key = nl_cache.key(collection_name, params)
+            cached = nl_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = ts.cached_search(collection_name, params, _format_search_result)
+        if nl_cache is not None:
+            nl_cache.put(cache_key, result)
+        return result
+
+    @mcp.tool()
+    def get_search_cache_stats() -> dict:
+        """Get hit/miss statistics for the server's local search result cache.
+
+        Covers hybrid_search, keyword_search, and natural_language_search.
+        """
+        return ts.query_cache.stats()
 
     @mcp.tool()
     def multi_search(
@@ -253,7 +271,7 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
             common_filter_by: Common filter_by applied to all searches.
             common_per_page: Common per_page applied to all searches.
         """
-        searches = json.loads(searches_json)
+        searches = loads(searches_json)
         common: dict[str, Any] = {}
         if common_query_by:
             common["query_by"] = common_query_by
@@ -262,18 +280,45 @@ def register(mcp: FastMCP, ts: TypesenseClientManager) -> None:
         if common_per_page != 10:
             common["per_page"] = common_per_page
 
-        result = ts.multi_search(searches, common)
+        # Identical sub-searches are sent once and fanned back out by index
+        unique_searches, positions = _dedupe_searches(searches)
+        results = [_format_search_result(res) for res in ts.search_many(unique_searches, common)]
 
         formatted_results = []
-        for i, res in enumerate(result.get("results", [])):
+        for i, pos in enumerate(positions):
             formatted_results.append({
                 "search_index": i,
-                **_format_search_result(res),
+                **results[pos],
             })
 
         return {"results": formatted_results}
 
 
+@lru_cache(maxsize=256)
+def _first_field(query_by: str) -> str:
+    """Return the first field of a comma-separated query_by string."""
+    return query_by.split(",", 1)[0].strip()
+
+
+def _dedupe_searches(searches: list[dict]) -> tuple[list[dict], list[int]]:
+    """Collapse identical sub-searches.
+
+    Returns the unique searches plus, for each original search, the index of
+    its unique counterpart.
+    """
+    index_by_key: dict[bytes, int] = {}
+    unique: list[dict] = []
+    positions: list[int] = []
+    for search in searches:
+        key = canonical_key(search)
+        pos = index_by_key.get(key)
+        if pos is None:
+            pos = index_by_key[key] = len(unique)
+            unique.append(search)
+        positions.append(pos)
+    return unique, positions
+
+
 def _format_search_result(result: dict) -> dict:
     """Format a Typesense search result into a cleaner structure."""
     output: dict[str, Any] = {
@@ -282,32 +327,7 @@ def _format_search_result(result: dict) -> dict:
         "search_time_ms": result.get("search_time_ms", 0),
     }
 
-    # Format hits
-    hits = []
-    for hit in result.get("hits", []):
-        formatted_hit: dict[str, Any] = {
-            "document": hit.get("document", {}),
-        }
-
-        # Include text match info if available
-        if "text_match_info" in hit:
-            formatted_hit["text_match_info"] = hit["text_match_info"]
-
-        # Include vector distance if available (for hybrid/vector searches)
-        if "vector_distance" in hit:
-            formatted_hit["vector_distance"] = hit["vector_distance"]
-
-        # Include highlights
-        if hit.get("highlights"):
-            formatted_hit["highlights"] = hit["highlights"]
-
-        # Include hybrid score if available
-        if "hybrid_search_info" in hit:
-            formatted_hit["hybrid_search_info"] = hit["hybrid_search_info"]
-
-        hits.append(formatted_hit)
-
-    output["hits"] = hits
+    output["hits"] = [_format_hit(hit) for hit in result.get("hits", [])]
 
     # Include facet counts if present
     if result.get("facet_counts"):
@@ -322,3 +342,28 @@ def _format_search_result(result: dict) -> dict:
         output["parsed_nl_query"] = result["parsed_nl_query"]
 
     return output
+
+
+def _format_hit(hit: dict) -> dict:
+    """Keep the document and the scoring/highlight info from a single hit."""
+    formatted_hit: dict[str, Any] = {
+        "document": hit.get("document", {}),
+    }
+
+    # Include text match info if available
+    if "text_match_info" in hit:
+        formatted_hit["text_match_info"] = hit["text_match_info"]
+
+    # Include vector distance if available (for hybrid/vector searches)
+    if "vector_distance" in hit:
+        formatted_hit["vector_distance"] = hit["vector_distance"]
+
+    # Include highlights
+    if hit.get("highlights"):
+        formatted_hit["highlights"] = hit["highlights"]
+
+    # Include hybrid score if available
+    if "hybrid_search_info" in hit:
+        formatted_hit["hybrid_search_info"] = hit["hybrid_search_info"]
+
+    return formatted_hit
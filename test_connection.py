@@ -77,12 +77,48 @@ def main():
     print(f"   Embedding fields: {embedding_fields}")
     print(f"   Facet fields:     {facet_fields}")
 
+    # 4-7. The sample, keyword, hybrid, and facet probes are independent, so
+    # send them to Typesense in a single multi_search round-trip.
+    searches: dict[str, dict] = {
+        "sample": {"collection": target, "q": "*", "per_page": 3},
+    }
+    if text_fields:
+        query_by = ",".join(text_fields[:3])
+        searches["keyword"] = {
+            "collection": target,
+            "q": "*",
+            "query_by": query_by,
+            "per_page": 3,
+        }
+    if embedding_fields and text_fields:
+        hybrid_query_by = ",".join(text_fields[:2] + embedding_fields[:1])
+        searches["hybrid"] = {
+            "collection": target,
+            "q": "test",
+            "query_by": hybrid_query_by,
+            "exclude_fields": ",".join(embedding_fields),
+            "per_page": 3,
+            "rerank_hybrid_matches": True,
+        }
+    if facet_fields:
+        searches["facet"] = {
+            "collection": target,
+            "q": "*",
+            "query_by": text_fields[0] if text_fields else facet_fields[0],
+            "facet_by": facet_fields[0],
+            "max_facet_values": 5,
+            "per_page": 0,
+        }
+
+    results = dict(zip(searches, ts.search_many(list(searches.values()))))
+    ts.close()
+
     # 4. Sample documents
     print(f"\n{'=' * 60}")
     print(f"4. SAMPLE DOCUMENTS FROM: {target}")
     print("=" * 60)
 
-    sample = ts.search(target, {"q": "*", "per_page": 3})
+    sample = results["sample"]
     for i, hit in enumerate(sample.get("hits", [])):
         doc = hit.get("document", {})
         # Filter out large embedding arrays for display
@@ -94,35 +130,20 @@ def main():
         print(f"   {json.dumps(display, indent=4, default=str)[:500]}")
 
     # 5. Keyword search
-    if text_fields:
-        query_by = ",".join(text_fields[:3])
+    if "keyword" in results:
+        result = results["keyword"]
         print(f"\n{'=' * 60}")
-        print(f"5. KEYWORD SEARCH (query_by={query_by})")
+        print(f"5. KEYWORD SEARCH (query_by={searches['keyword']['query_by']})")
         print("=" * 60)
-
-        result = ts.search(target, {
-            "q": "*",
-            "query_by": query_by,
-            "per_page": 3,
-        })
         print(f"   Found: {result.get('found', 0)} documents")
         print(f"   Search time: {result.get('search_time_ms', '?')}ms")
 
     # 6. Hybrid search (if embedding fields exist)
-    if embedding_fields and text_fields:
-        hybrid_query_by = ",".join(text_fields[:2] + embedding_fields[:1])
-        exclude = ",".join(embedding_fields)
+    if "hybrid" in results:
+        result = results["hybrid"]
         print(f"\n{'=' * 60}")
-        print(f"6. HYBRID SEARCH (query_by={hybrid_query_by})")
+        print(f"6. HYBRID SEARCH (query_by={searches['hybrid']['query_by']})")
         print("=" * 60)
-
-        result = ts.search(target, {
-            "q": "test",
-            "query_by": hybrid_query_by,
-            "exclude_fields": exclude,
-            "per_page": 3,
-            "rerank_hybrid_matches": True,
-        })
         print(f"   Found: {result.get('found', 0)} documents")
         print(f"   Search time: {result.get('search_time_ms', '?')}ms")
         for i, hit in enumerate(result.get("hits", [])):
@@ -138,23 +159,22 @@ def main():
         print(f"\n   Skipping hybrid search — no embedding fields found in '{target}'.")
 
     # 7. Facet search
-    if facet_fields:
+    if "facet" in results:
+        result = results["facet"]
         print(f"\n{'=' * 60}")
         print(f"7. FACET QUERY (facet_by={facet_fields[0]})")
         print("=" * 60)
-
-        result = ts.search(target, {
-            "q": "*",
-            "query_by": text_fields[0] if text_fields else facet_fields[0],
-            "facet_by": facet_fields[0],
-            "max_facet_values": 5,
-            "per_page": 0,
-        })
         for fc in result.get("facet_counts", []):
             print(f"   Field: {fc['field_name']}")
             for v in fc.get("counts", [])[:5]:
                 print(f"     {v['value']:30s}  count={v['count']}")
 
+    failed = {label: r["error"] for label, r in results.items() if "error" in r}
+    if failed:
+        for label, error in failed.items():
+            print(f"\n   {label} search FAILED: {error}")
+        sys.exit(1)
+
     print(f"\n{'=' * 60}")
     print("ALL TESTS PASSED")
     print("=" * 60)
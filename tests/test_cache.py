@@ -0,0 +1,107 @@
+"""Tests for the in-process search result cache."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src import cache
+from src.cache import QueryCache, estimate_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's monotonic clock with a manually advanced one."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value():
+    qc = QueryCache(max_size=4)
+    qc.put("a", {"found": 1})
+    assert qc.get("a") == {"found": 1}
+    assert qc.get("missing") is None
+
+
+def test_evicts_least_recently_used():
+    qc = QueryCache(max_size=2)
+    qc.put("a", 1)
+    qc.put("b", 2)
+    qc.get("a")  # "b" is now the least recently used
+    qc.put("c", 3)
+    assert qc.get("b") is None
+    assert qc.get("a") == 1
+    assert qc.get("c") == 3
+    assert qc.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    qc = QueryCache(max_size=4, ttl_seconds=60)
+    qc.put("a", 1)
+    clock[0] += 59
+    assert qc.get("a") == 1
+    clock[0] += 2
+    assert qc.get("a") is None
+    assert qc.stats()["size"] == 0
+    assert qc.stats()["bytes"] == 0
+
+
+def test_evicts_by_bytes():
+    value = "x" * 98  # estimated at 100 bytes
+    qc = QueryCache(max_size=10, max_bytes=250)
+    qc.put("a", value)
+    qc.put("b", value)
+    qc.put("c", value)
+    assert qc.get("a") is None
+    assert qc.get("b") == value
+    assert qc.get("c") == value
+    assert qc.stats()["bytes"] == 200
+
+
+def test_rejects_value_larger_than_max_bytes():
+    qc = QueryCache(max_size=10, max_bytes=50)
+    qc.put("small", "x")
+    qc.put("big", "x" * 100)
+    assert qc.get("big") is None
+    assert qc.get("small") == "x"
+
+
+def test_replacing_a_key_updates_byte_total():
+    qc = QueryCache(max_size=10)
+    qc.put("a", "x" * 98)
+    qc.put("a", "x")
+    assert qc.stats()["bytes"] == estimate_size("x")
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_size": 0}, {"ttl_seconds": 0}, {"max_bytes": 0}]
+)
+def test_zero_limit_disables_cache(kwargs):
+    qc = QueryCache(**kwargs)
+    calls = []
+    for _ in range(2):
+        qc.get_or_compute("a", lambda: calls.append(1) or "v")
+    assert not qc.enabled
+    assert len(calls) == 2
+
+
+def test_get_or_compute_caches_result():
+    qc = QueryCache()
+    calls = []
+    for _ in range(3):
+        assert qc.get_or_compute("a", lambda: calls.append(1) or "v") == "v"
+    assert len(calls) == 1
+    assert qc.stats()["hits"] == 2
+
+
+def test_estimate_size_sizes_numeric_arrays_by_length():
+    assert estimate_size([0.5] * 1536) == estimate_size([1] * 1536)
+    assert estimate_size({"embedding": [0.1] * 10}) > estimate_size({"embedding": [0.1]})
+
+
+def test_estimate_size_tracks_json_size():
+    doc = {"id": "1", "title": "t" * 80, "tags": ["a", "b"], "score": 0.5, "ok": None}
+    actual = len(json.dumps(doc, separators=(",", ":")))
+    assert actual <= estimate_size(doc) <= actual * 1.5
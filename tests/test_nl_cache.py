@@ -0,0 +1,40 @@
+"""Tests for the persistent natural language search cache."""
+
+from __future__ import annotations
+
+from src import nl_cache
+from src.nl_cache import NLQueryCache
+
+
+def test_round_trip(tmp_path):
+    cache = NLQueryCache(str(tmp_path / "nl.sqlite"))
+    key = cache.key("cars", {"q": "red suv"})
+    assert cache.get(key) is None
+    cache.put(key, {"found": 3, "hits": []})
+    assert cache.get(key) == {"found": 3, "hits": []}
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "nl.sqlite")
+    first = NLQueryCache(path)
+    key = first.key("cars", {"q": "red suv"})
+    first.put(key, {"found": 1})
+    first.close()
+    assert NLQueryCache(path).get(key) == {"found": 1}
+
+
+def test_entries_expire(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(nl_cache.time, "time", lambda: now[0])
+    cache = NLQueryCache(str(tmp_path / "nl.sqlite"), ttl_seconds=10)
+    key = cache.key("cars", {"q": "red suv"})
+    cache.put(key, {"found": 1})
+    now[0] += 11
+    assert cache.get(key) is None
+
+
+def test_key_ignores_param_order_but_not_collection():
+    a = NLQueryCache.key("cars", {"q": "x", "per_page": 10})
+    b = NLQueryCache.key("cars", {"per_page": 10, "q": "x"})
+    assert a == b
+    assert a != NLQueryCache.key("trucks", {"q": "x", "per_page": 10})
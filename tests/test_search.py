@@ -0,0 +1,53 @@
+"""Tests for multi_search de-duplication in the search tools."""
+
+from __future__ import annotations
+
+from src.tools import search
+from src.tools.search import _dedupe_searches
+
+
+class _FakeMCP:
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+        return decorator
+
+
+class _FakeTS:
+    def __init__(self):
+        self.sent = []
+
+    def search_many(self, searches, common_params=None):
+        self.sent.append(searches)
+        return [{"found": i, "hits": []} for i, _ in enumerate(searches)]
+
+
+def test_dedupe_collapses_identical_searches():
+    a = {"collection": "products", "q": "laptop"}
+    b = {"collection": "reviews", "q": "laptop"}
+    unique, positions = _dedupe_searches([a, b, {"q": "laptop", "collection": "products"}, b])
+    assert unique == [a, b]
+    assert positions == [0, 1, 0, 1]
+
+
+def test_dedupe_keeps_distinct_searches():
+    searches = [{"collection": "c", "q": str(i)} for i in range(3)]
+    unique, positions = _dedupe_searches(searches)
+    assert unique == searches
+    assert positions == [0, 1, 2]
+
+
+def test_multi_search_fans_results_back_out():
+    mcp, ts = _FakeMCP(), _FakeTS()
+    search.register(mcp, ts)
+    result = mcp.tools["multi_search"](
+        '[{"collection": "a", "q": "x"}, {"collection": "b", "q": "y"},'
+        ' {"collection": "a", "q": "x"}]'
+    )
+    assert len(ts.sent[0]) == 2
+    assert [r["search_index"] for r in result["results"]] == [0, 1, 2]
+    assert [r["found"] for r in result["results"]] == [0, 1, 0]